@@ -62,6 +62,7 @@ This allows API tokens for programmatic access alongside OAuth for users.
 from __future__ import annotations
 
 import os
+import threading
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -74,10 +75,29 @@ AUTH0_CLIENT_ID_VAR = "FASTMCP_SERVER_AUTH_AUTH0_CLIENT_ID"
 AUTH0_CLIENT_SECRET_VAR = "FASTMCP_SERVER_AUTH_AUTH0_CLIENT_SECRET"
 AUTH0_AUDIENCE_VAR = "FASTMCP_SERVER_AUTH_AUTH0_AUDIENCE"
 AUTH0_BASE_URL_VAR = "FASTMCP_SERVER_AUTH_AUTH0_BASE_URL"
+AUTH0_REQUIRED_SCOPES_VAR = "FASTMCP_SERVER_AUTH_AUTH0_REQUIRED_SCOPES"
 AUTH_ALLOWED_EMAILS_VAR = "MCP_PROXY_AUTH_ALLOWED_EMAILS"
 AUTH_REQUIRE_VERIFIED_EMAIL_VAR = "MCP_PROXY_AUTH_REQUIRE_EMAIL_VERIFIED"
 AUTH_ENABLE_CIMD_VAR = "MCP_PROXY_AUTH_ENABLE_CIMD"
 
+# Every variable that affects the provider built by create_auth_provider()
+_AUTH_ENV_VARS = (
+    AUTH_TOKENS_VAR,
+    AUTH0_CONFIG_URL_VAR,
+    AUTH0_CLIENT_ID_VAR,
+    AUTH0_CLIENT_SECRET_VAR,
+    AUTH0_AUDIENCE_VAR,
+    AUTH0_BASE_URL_VAR,
+    AUTH0_REQUIRED_SCOPES_VAR,
+    AUTH_ALLOWED_EMAILS_VAR,
+    AUTH_REQUIRE_VERIFIED_EMAIL_VAR,
+    AUTH_ENABLE_CIMD_VAR,
+)
+
+# Memoized (env snapshot, provider) pair for create_auth_provider()
+_provider_lock = threading.Lock()
+_provider_cache: tuple[tuple[str | None, ...], AuthProvider | None] | None = None
+
 
 def parse_token_config(token_str: str) -> tuple[str, dict]:
     """Parse a token string into token and metadata.
@@ -185,19 +205,41 @@ def is_static_auth_configured() -> bool:
     return len(get_static_tokens()) > 0
 
 
+def get_oidc_settings() -> dict[str, str] | None:
+    """Read the required Auth0/OIDC settings from the environment.
+
+    Returns a dict of OIDCProxy keyword arguments, or None if any required
+    variable is unset or empty.
+    """
+    settings = {
+        "config_url": os.environ.get(AUTH0_CONFIG_URL_VAR),
+        "client_id": os.environ.get(AUTH0_CLIENT_ID_VAR),
+        "client_secret": os.environ.get(AUTH0_CLIENT_SECRET_VAR),
+        "audience": os.environ.get(AUTH0_AUDIENCE_VAR),
+        "base_url": os.environ.get(AUTH0_BASE_URL_VAR),
+    }
+    if not all(settings.values()):
+        return None
+    return settings
+
+
+def get_required_scopes() -> list[str] | None:
+    """Get required OIDC scopes from the environment.
+
+    Returns None (no scope checking) if the variable is unset or empty.
+    """
+    scopes_env = os.environ.get(AUTH0_REQUIRED_SCOPES_VAR, "")
+    if not scopes_env:
+        return None
+    return [s.strip() for s in scopes_env.split(",") if s.strip()]
+
+
 def is_oidc_auth_configured() -> bool:
     """Check if OIDC/Auth0 authentication is configured via environment variables.
 
     Returns True if all required Auth0 environment variables are set.
     """
-    required_vars = [
-        AUTH0_CONFIG_URL_VAR,
-        AUTH0_CLIENT_ID_VAR,
-        AUTH0_CLIENT_SECRET_VAR,
-        AUTH0_AUDIENCE_VAR,
-        AUTH0_BASE_URL_VAR,
-    ]
-    return all(os.environ.get(var) for var in required_vars)
+    return get_oidc_settings() is not None
 
 
 def is_auth_configured() -> bool:
@@ -217,24 +259,23 @@ def _create_static_token_provider() -> "AuthProvider":
     return StaticTokenVerifier(tokens=token_dict)
 
 
-def _create_oidc_provider() -> "AuthProvider":
-    """Create an OIDC provider from environment variables."""
+def _create_oidc_provider(
+    settings: dict[str, str] | None = None,
+) -> "AuthProvider":
+    """Create an OIDC provider from environment variables.
+
+    Args:
+        settings: Settings already read by get_oidc_settings(). If omitted,
+            they are read from the environment.
+    """
     from fastmcp.server.auth.oidc_proxy import OIDCProxy
 
-    # Parse required_scopes - None means no scope checking
-    scopes_env = os.environ.get("FASTMCP_SERVER_AUTH_AUTH0_REQUIRED_SCOPES", "")
-    if scopes_env:
-        required_scopes = [s.strip() for s in scopes_env.split(",") if s.strip()]
-    else:
-        required_scopes = None
+    if settings is None:
+        settings = get_oidc_settings() or {}
 
     return OIDCProxy(
-        config_url=os.environ.get(AUTH0_CONFIG_URL_VAR),
-        client_id=os.environ.get(AUTH0_CLIENT_ID_VAR),
-        client_secret=os.environ.get(AUTH0_CLIENT_SECRET_VAR),
-        audience=os.environ.get(AUTH0_AUDIENCE_VAR),
-        base_url=os.environ.get(AUTH0_BASE_URL_VAR),
-        required_scopes=required_scopes,
+        **settings,
+        required_scopes=get_required_scopes(),
         enable_cimd=enable_cimd(),
     )
 
@@ -434,11 +475,23 @@ class RestrictedAuthProvider:
         return True
 
 
+def clear_auth_provider_cache() -> None:
+    """Forget the memoized provider so the next call rebuilds it."""
+    global _provider_cache
+    with _provider_lock:
+        _provider_cache = None
+
+
 def create_auth_provider() -> "AuthProvider | None":
     """Create an auth provider from environment variables.
 
     Returns None if no authentication is configured.
 
+    The provider is memoized per process: repeated calls with the same auth
+    environment return the same instance instead of rebuilding it (and
+    re-fetching the OIDC discovery document). Changing any auth variable,
+    e.g. by loading a .env file, causes the provider to be rebuilt.
+
     Supports three modes:
     1. Static tokens only (MCP_PROXY_AUTH_TOKENS)
     2. OIDC only (FASTMCP_SERVER_AUTH_AUTH0_* vars)
@@ -453,15 +506,29 @@ def create_auth_provider() -> "AuthProvider | None":
     - FASTMCP_SERVER_AUTH_AUTH0_BASE_URL: Public URL of your proxy
     - FASTMCP_SERVER_AUTH_AUTH0_REQUIRED_SCOPES: Comma-separated scopes (optional)
     """
+    global _provider_cache
+    env_key = tuple(os.environ.get(var) for var in _AUTH_ENV_VARS)
+    with _provider_lock:
+        if _provider_cache is not None and _provider_cache[0] == env_key:
+            return _provider_cache[1]
+        provider = _build_auth_provider()
+        _provider_cache = (env_key, provider)
+    return provider
+
+
+def _build_auth_provider() -> "AuthProvider | None":
+    """Build a new auth provider from environment variables."""
+    # Read the OIDC settings once and reuse them for provider construction
+    oidc_settings = get_oidc_settings()
     has_static = is_static_auth_configured()
-    has_oidc = is_oidc_auth_configured()
+    has_oidc = oidc_settings is not None
 
     if not has_static and not has_oidc:
         return None
 
     # Create providers as needed
     static_provider = _create_static_token_provider() if has_static else None
-    oidc_provider = _create_oidc_provider() if has_oidc else None
+    oidc_provider = _create_oidc_provider(oidc_settings) if has_oidc else None
 
     allowed_emails = get_allowed_emails()
     if allowed_emails and oidc_provider is not None:
@@ -6,6 +6,16 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def _clear_auth_provider_cache():
+    """Keep memoized auth providers from leaking between tests."""
+    from mcp_proxy.auth import clear_auth_provider_cache
+
+    clear_auth_provider_cache()
+    yield
+    clear_auth_provider_cache()
+
+
 class TestParseTokenConfig:
     """Tests for parse_token_config function."""
 
@@ -1048,3 +1058,95 @@ class TestIsOidcAuthConfigured:
             clear=True,
         ):
             assert is_oidc_auth_configured() is True
+
+
+class TestGetOidcSettings:
+    """Tests for get_oidc_settings and get_required_scopes."""
+
+    def test_returns_none_when_any_env_var_missing(self):
+        """get_oidc_settings returns None unless every required var is set."""
+        from mcp_proxy.auth import get_oidc_settings
+
+        with patch.dict(
+            os.environ,
+            {"FASTMCP_SERVER_AUTH_AUTH0_CLIENT_ID": "test-client-id"},
+            clear=True,
+        ):
+            assert get_oidc_settings() is None
+
+    def test_returns_oidc_proxy_kwargs(self):
+        """get_oidc_settings maps env vars to OIDCProxy keyword arguments."""
+        from mcp_proxy.auth import get_oidc_settings
+
+        with patch.dict(
+            os.environ,
+            {
+                "FASTMCP_SERVER_AUTH_AUTH0_CONFIG_URL": "https://test.auth0.com/.well-known/openid-configuration",
+                "FASTMCP_SERVER_AUTH_AUTH0_CLIENT_ID": "test-client-id",
+                "FASTMCP_SERVER_AUTH_AUTH0_CLIENT_SECRET": "test-client-secret",
+                "FASTMCP_SERVER_AUTH_AUTH0_AUDIENCE": "https://api.test.com",
+                "FASTMCP_SERVER_AUTH_AUTH0_BASE_URL": "http://localhost:8000",
+            },
+            clear=True,
+        ):
+            assert get_oidc_settings() == {
+                "config_url": "https://test.auth0.com/.well-known/openid-configuration",
+                "client_id": "test-client-id",
+                "client_secret": "test-client-secret",
+                "audience": "https://api.test.com",
+                "base_url": "http://localhost:8000",
+            }
+
+    def test_required_scopes_none_when_unset(self):
+        """get_required_scopes returns None when no scopes are configured."""
+        from mcp_proxy.auth import get_required_scopes
+
+        with patch.dict(os.environ, {}, clear=True):
+            assert get_required_scopes() is None
+
+    def test_required_scopes_parsed_and_stripped(self):
+        """get_required_scopes splits on commas and drops empty entries."""
+        from mcp_proxy.auth import get_required_scopes
+
+        with patch.dict(
+            os.environ,
+            {"FASTMCP_SERVER_AUTH_AUTH0_REQUIRED_SCOPES": "read:tools, ,write:tools"},
+            clear=True,
+        ):
+            assert get_required_scopes() == ["read:tools", "write:tools"]
+
+
+class TestCreateAuthProviderMemoization:
+    """Tests for create_auth_provider memoization."""
+
+    def test_returns_same_provider_for_unchanged_env(self):
+        """Repeated calls with the same env reuse the provider."""
+        from mcp_proxy.auth import create_auth_provider
+
+        with patch.dict(os.environ, {"MCP_PROXY_AUTH_TOKENS": "my-token"}, clear=True):
+            first = create_auth_provider()
+            assert create_auth_provider() is first
+
+    def test_rebuilds_provider_when_env_changes(self):
+        """Changing an auth env var produces a fresh provider."""
+        from mcp_proxy.auth import create_auth_provider
+
+        with patch.dict(os.environ, {"MCP_PROXY_AUTH_TOKENS": "my-token"}, clear=True):
+            first = create_auth_provider()
+        with patch.dict(
+            os.environ, {"MCP_PROXY_AUTH_TOKENS": "other-token"}, clear=True
+        ):
+            second = create_auth_provider()
+            assert second is not first
+            assert "other-token" in second.tokens
+        with patch.dict(os.environ, {}, clear=True):
+            assert create_auth_provider() is None
+
+    def test_clear_cache_forces_rebuild(self):
+        """clear_auth_provider_cache drops the memoized provider."""
+        from mcp_proxy.auth import clear_auth_provider_cache, create_auth_provider
+
+        with patch.dict(os.environ, {"MCP_PROXY_AUTH_TOKENS": "my-token"}, clear=True):
+            first = create_auth_provider()
+            clear_auth_provider_cache()
+            assert create_auth_provider() is not first